@@ -93,9 +93,12 @@ def run(task, top_k, indexer_query_type):
         evaluation_results = defaultdict(float)
 
         def _get_evaluation_results(evaluation_results: dict, resp):
-            for d in resp.search.docs:
-                for eval in d.evaluations:
-                    evaluation_results[eval.op_name] = eval.value
+            # the evaluator returns a running avg, so the last doc already holds the value for the whole batch
+            docs = resp.search.docs
+            if not docs:
+                return
+            for eval in docs[-1].evaluations:
+                evaluation_results[eval.op_name] = eval.value
 
         get_evaluation_results = partial(_get_evaluation_results, evaluation_results)
 
@@ -105,7 +108,7 @@ def run(task, top_k, indexer_query_type):
             flow.search(input_fn=evaluate_generator(data_path, groundtruth_path), request_size=request_size,
                         on_done=get_evaluation_results,
                         top_k=top_k)
-        evaluation = evaluation_results[list(evaluation_results.keys())[0]]
+        evaluation = next(iter(evaluation_results.values()))
         # return for test
         print(f'Recall@{top_k} ==> {100 * evaluation}')
         return 100 * evaluation
@@ -14,7 +14,8 @@ class Flickr30kDataset(data.Dataset):
 
     def __init__(self, images_root, json, split):
         self.images_root = images_root
-        self.dataset = jsonmod.load(open(json, 'r'))['images']
+        with open(json, 'r') as fp:
+            self.dataset = jsonmod.load(fp)['images']
         self.ids = []
         for i, d in enumerate(self.dataset):
             if d['split'] == split:
@@ -147,6 +147,9 @@ def index(num_doc, target: dict):
 
 
 def query(num_doc, target: dict):
+    # start from a clean state so a previous query run does not leak into this one
+    result_html.clear()
+    evaluation_value.clear()
     f = Flow.load_config('flows/query.yml')
     with f:
         f.search(query_generator(num_doc, target), shuffle=True, size=128,
@@ -16,6 +16,7 @@ def config():
     parallel = 2 if sys.argv[1] == 'index' else 1
 
     os.environ.setdefault('JINA_MAX_DOCS', '100')
+    os.environ.setdefault('JINA_REQUEST_SIZE', '8')
     os.environ.setdefault('JINA_PARALLEL', str(parallel))
     os.environ.setdefault('JINA_SHARDS', str(4))
     os.environ.setdefault('JINA_WORKSPACE', './workspace')
@@ -42,7 +43,7 @@ def input_fn():
 def index():
     f = Flow.load_config('flows/index.yml')
     with f:
-        f.index(input_fn, request_size=8)
+        f.index(input_fn, request_size=int(os.environ['JINA_REQUEST_SIZE']))
 
 
 # for search
@@ -78,7 +78,8 @@ def get_flow():
 
 @pytest.fixture
 def queries_and_expected_replies():
-    return json.load(open('tests/query_results.json', 'r'))
+    with open('tests/query_results.json', 'r') as fp:
+        return json.load(fp)
 
 
 def test_query(tmpdir, queries_and_expected_replies):
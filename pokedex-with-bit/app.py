@@ -7,6 +7,7 @@ import sys
 from jina.flow import Flow
 
 num_docs = int(os.environ.get('JINA_MAX_DOCS', 50000))
+request_size = int(os.environ.get('JINA_REQUEST_SIZE', 64))
 image_src = 'data/**/*.png'
 
 
@@ -25,7 +26,7 @@ def index():
     f = Flow.load_config('flows/index.yml')
 
     with f:
-        f.index_files(image_src, request_size=64, read_mode='rb', size=num_docs)
+        f.index_files(image_src, request_size=request_size, read_mode='rb', size=num_docs)
 
 
 # for search